@@ -5,11 +5,19 @@ Podcast Transcriber Web App with OpenAI API
 A Flask web application for transcribing podcast episodes from RSS feeds using OpenAI's Whisper API.
 """
 
+from collections import OrderedDict
+import glob
+import io
+import math
 import os
+import queue
 import sys
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import feedparser
 from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for
 from urllib.parse import urlparse
@@ -18,6 +26,7 @@ import json
 from dotenv import load_dotenv
 import openai
 from openai import OpenAI
+import shutil
 import subprocess
 import tempfile
 from pydub import AudioSegment
@@ -28,9 +37,228 @@ load_dotenv()
 app = Flask(__name__)
 app.secret_key = os.getenv('SECRET_KEY', 'your-secret-key-here-change-in-production')
 
-# Global variables for transcription status
-transcription_status = {}
-transcription_results = {}
+class StatusStore:
+    """Per-task key/value storage shared by worker threads and request handlers.
+    
+    Backed by Redis hashes when a Redis URL is given, so several app workers
+    see the same tasks; otherwise kept in process memory. Both backends are
+    bounded: Redis keys expire after `ttl` seconds without updates, and the
+    in-memory store evicts the oldest tasks beyond `max_entries`, finished
+    tasks first. Only `create` adds a record; writes to a task that has been
+    evicted or expired are dropped rather than leaving a partial record.
+    """
+    
+    # HSET + EXPIRE only if the hash still exists, in one atomic round trip
+    _UPDATE_IF_EXISTS = """
+    if redis.call('EXISTS', KEYS[1]) == 1 then
+        redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+        redis.call('EXPIRE', KEYS[1], ARGV[1])
+        return 1
+    end
+    return 0
+    """
+    
+    FINISHED_STATUSES = ('completed', 'error')
+    
+    def __init__(self, name, redis_url=None, max_entries=1000, ttl=24 * 3600):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._data = OrderedDict()
+        self._redis = None
+        if redis_url:
+            import redis
+            self._redis = redis.Redis.from_url(redis_url)
+            self._update_if_exists = self._redis.register_script(self._UPDATE_IF_EXISTS)
+    
+    def _key(self, task_id):
+        return f"podcast_txt:{self.name}:{task_id}"
+    
+    def __contains__(self, task_id):
+        if self._redis:
+            return bool(self._redis.exists(self._key(task_id)))
+        with self._lock:
+            return task_id in self._data
+    
+    def get(self, task_id):
+        """Return a snapshot of all fields for a task, or None if the task is unknown."""
+        if self._redis:
+            # Values are JSON-encoded so numbers keep their type
+            data = self._redis.hgetall(self._key(task_id))
+            return {key.decode('utf-8'): json.loads(value) for key, value in data.items()} or None
+        with self._lock:
+            data = self._data.get(task_id)
+            return dict(data) if data is not None else None
+    
+    def get_fields(self, task_id, fields):
+        """Return only the given fields of a task, or None if the task has none of them."""
+        if self._redis:
+            values = self._redis.hmget(self._key(task_id), fields)
+            return {field: json.loads(value) for field, value in zip(fields, values) if value is not None} or None
+        with self._lock:
+            data = self._data.get(task_id)
+            return {field: data[field] for field in fields if field in data} if data else None
+    
+    def set(self, task_id, key, value):
+        """Set a single field for a task."""
+        self.update(task_id, {key: value})
+    
+    def create(self, task_id, mapping):
+        """Store a new record for a task, replacing any previous one."""
+        if self._redis:
+            key = self._key(task_id)
+            pipe = self._redis.pipeline()
+            pipe.delete(key)
+            pipe.hset(key, mapping={field: json.dumps(value) for field, value in mapping.items()})
+            pipe.expire(key, self.ttl)
+            pipe.execute()
+            return
+        with self._lock:
+            self._data.pop(task_id, None)
+            self._data[task_id] = dict(mapping)
+            self._evict_if_full(keep=task_id)
+    
+    def update(self, task_id, mapping):
+        """Set several fields for an existing task in one operation.
+        
+        Unknown tasks are ignored; returns whether the task existed.
+        """
+        if self._redis:
+            args = [self.ttl]
+            for field, value in mapping.items():
+                args.extend((field, json.dumps(value)))
+            return bool(self._update_if_exists(keys=[self._key(task_id)], args=args))
+        with self._lock:
+            if task_id not in self._data:
+                return False
+            self._data[task_id].update(mapping)
+            return True
+    
+    def pop(self, task_id):
+        """Remove a task and return its last fields, or None if the task is unknown."""
+        if self._redis:
+            key = self._key(task_id)
+            pipe = self._redis.pipeline()
+            pipe.hgetall(key)
+            pipe.delete(key)
+            data, _ = pipe.execute()
+            return {field.decode('utf-8'): json.loads(value) for field, value in data.items()} or None
+        with self._lock:
+            return self._data.pop(task_id, None)
+    
+    def _evict_if_full(self, keep):
+        # Prefer dropping the oldest finished task; only drop running tasks if nothing else is left
+        while len(self._data) > self.max_entries:
+            for task_id, data in self._data.items():
+                if task_id != keep and data.get('status', 'completed') in self.FINISHED_STATUSES:
+                    del self._data[task_id]
+                    break
+            else:
+                self._data.popitem(last=False)
+
+# Task status and results; set REDIS_URL to share them between app workers
+REDIS_URL = os.getenv('REDIS_URL')
+transcription_status = StatusStore('status', REDIS_URL)
+transcription_results = StatusStore('results', REDIS_URL)
+
+# Finished tasks keyed by episode audio URL, so asking for the same episode again reuses the transcript
+transcribed_episodes = StatusStore('episodes', REDIS_URL)
+
+# How long finished transcripts stay downloadable before they are deleted
+TASK_RETENTION_SECONDS = 3600
+
+def schedule_expiry(task_id, delay=TASK_RETENTION_SECONDS):
+    """Run expire_task for a task once `delay` seconds have passed."""
+    cleanup_timer = threading.Timer(delay, expire_task, args=(task_id,))
+    cleanup_timer.daemon = True
+    cleanup_timer.start()
+
+def expire_task(task_id):
+    """Forget a finished task and delete its transcript files."""
+    # Pop first so a concurrent reuse either pushed expires_at before this
+    # (and is honoured below) or finds the task gone and starts a new one
+    status = transcription_status.pop(task_id)
+    remaining = status.get('expires_at', 0) - time.time() if status else 0
+    if remaining > 0:
+        # The task was reused after the timer was armed; keep it until its new deadline
+        transcription_status.create(task_id, status)
+        schedule_expiry(task_id, remaining)
+        return
+    
+    if status and status.get('audio_url'):
+        episode = transcribed_episodes.get(status['audio_url'])
+        if episode and episode.get('task_id') == task_id:
+            transcribed_episodes.pop(status['audio_url'])
+    
+    result = transcription_results.pop(task_id)
+    if result:
+        for filename in (result.get('txt_file'), result.get('srt_file')):
+            if filename and os.path.exists(filename):
+                os.remove(filename)
+
+# Maximum number of chunks uploaded to OpenAI at the same time
+MAX_CONCURRENT_CHUNKS = 5
+
+# Options for every Whisper API request
+TRANSCRIBE_KWARGS = dict(
+    model="whisper-1",
+    language="no",  # Norwegian
+    response_format="verbose_json",
+    timestamp_granularities=["segment"]
+)
+
+# Largest file sent to OpenAI in one request (the API limit is 25MB)
+MAX_UPLOAD_SIZE_MB = 24
+
+# Segment length used when splitting while downloading; 10 minutes stays
+# below OpenAI's 25MB upload limit for MP3s up to 320 kbps
+STREAM_SEGMENT_SECONDS = 600
+
+# Task status fields returned by /status/<task_id>
+STATUS_RESPONSE_FIELDS = (
+    'status', 'progress', 'episode_title', 'download_progress', 'download_speed',
+    'eta', 'audio_duration', 'language', 'language_probability', 'error'
+)
+
+# Download read size and minimum interval between progress updates
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+PROGRESS_UPDATE_INTERVAL = 0.25  # seconds
+
+# Parsed RSS feeds, keyed by URL, so episode selection doesn't re-fetch the feed
+RSS_CACHE_TTL = 300  # seconds
+rss_cache = {}
+rss_cache_lock = threading.Lock()
+
+# ETag/Last-Modified of recently fetched feeds with their episodes, for conditional GETs
+MAX_FEED_VALIDATORS = 128
+feed_validators = OrderedDict()
+feed_validators_lock = threading.Lock()
+
+# Transcription jobs are run by a fixed pool of background workers, so the
+# number of concurrent downloads and uploads stays bounded under load. Each
+# task uploads up to MAX_CONCURRENT_CHUNKS chunks at once, so the pool is
+# sized from the total number of uploads the server should have in flight.
+MAX_CONCURRENT_UPLOADS = int(os.getenv('MAX_CONCURRENT_UPLOADS', '100'))
+MAX_CONCURRENT_TASKS = int(os.getenv('MAX_CONCURRENT_TASKS',
+                                     str(max(1, MAX_CONCURRENT_UPLOADS // MAX_CONCURRENT_CHUNKS))))
+task_queue = queue.Queue()
+
+def task_worker():
+    """Run queued transcription jobs until the process exits."""
+    while True:
+        job = task_queue.get()
+        try:
+            job()
+        except Exception as e:
+            print(f"Unhandled error in transcription job: {e}")
+        finally:
+            task_queue.task_done()
+
+for _ in range(MAX_CONCURRENT_TASKS):
+    worker = threading.Thread(target=task_worker)
+    worker.daemon = True
+    worker.start()
 
 # OpenAI configuration
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
@@ -39,8 +267,16 @@ if not OPENAI_API_KEY:
 
 client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
 
-def download_audio(url, filename, task_id):
-    """Download audio file from URL with progress reporting."""
+# Shared HTTP session so repeat downloads from the same podcast host reuse connections
+DOWNLOAD_TIMEOUT = (10, 60)  # (connect, read) seconds
+http_session = requests.Session()
+http_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                           max_retries=Retry(total=3, backoff_factor=0.3))
+http_session.mount('http://', http_adapter)
+http_session.mount('https://', http_adapter)
+
+def open_audio_stream(url):
+    """Open a streaming HTTP response for an audio URL, retrying with alternative headers on 403."""
     
     headers = {
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -52,7 +288,7 @@ def download_audio(url, filename, task_id):
     }
     
     try:
-        response = requests.get(url, stream=True, headers=headers, timeout=30)
+        response = http_session.get(url, stream=True, headers=headers, timeout=DOWNLOAD_TIMEOUT)
         response.raise_for_status()
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 403:
@@ -62,7 +298,7 @@ def download_audio(url, filename, task_id):
                 'Accept': '*/*'
             }
             try:
-                response = requests.get(url, stream=True, headers=alt_headers, timeout=30)
+                response = http_session.get(url, stream=True, headers=alt_headers, timeout=DOWNLOAD_TIMEOUT)
                 response.raise_for_status()
             except requests.exceptions.HTTPError as e2:
                 if e2.response.status_code == 403:
@@ -76,30 +312,131 @@ def download_audio(url, filename, task_id):
     except requests.exceptions.RequestException as e:
         raise Exception(f"Failed to download audio file: {e}")
     
+    return response
+
+def write_audio_stream(response, f, task_id, max_bytes=None):
+    """Copy an audio response into a writable file object with progress reporting.
+    
+    Raises if the body grows past `max_bytes`, when given.
+    """
     total_size = int(response.headers.get('content-length', 0))
     downloaded = 0
-    start_time = time.time()
+    start_time = time.monotonic()
+    last_update = start_time
     
+    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+        if chunk:
+            downloaded += len(chunk)
+            if max_bytes is not None and downloaded > max_bytes:
+                raise Exception(f"Audio download is larger than announced ({total_size} bytes) "
+                                f"and exceeds the {max_bytes // (1024 * 1024)}MB upload limit")
+            f.write(chunk)
+            now = time.monotonic()
+            
+            # Throttle status updates so the copy loop stays cheap
+            if total_size > 0 and (now - last_update >= PROGRESS_UPDATE_INTERVAL or downloaded >= total_size):
+                last_update = now
+                progress = (downloaded / total_size) * 100
+                elapsed = now - start_time
+                
+                update = {
+                    'download_progress': progress,
+                    'download_speed': f"{(downloaded / 1024 / 1024 / elapsed):.1f} MB/s" if elapsed > 0 else "0 MB/s"
+                }
+                
+                # Calculate ETA
+                if progress > 0:
+                    eta_seconds = (elapsed / progress) * (100 - progress)
+                    eta_minutes = eta_seconds / 60
+                    update['eta'] = f"{eta_minutes:.1f} min"
+                
+                transcription_status.update(task_id, update)
+
+def download_audio(response, filename, task_id):
+    """Download an opened audio response to a file with progress reporting."""
     with open(filename, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:
-                f.write(chunk)
-                downloaded += len(chunk)
-                if total_size > 0:
-                    progress = (downloaded / total_size) * 100
-                    elapsed = time.time() - start_time
-                    
-                    # Calculate ETA
-                    if progress > 0:
-                        eta_seconds = (elapsed / progress) * (100 - progress)
-                        eta_minutes = eta_seconds / 60
-                        transcription_status[task_id]['eta'] = f"{eta_minutes:.1f} min"
-                    
-                    transcription_status[task_id]['download_progress'] = progress
-                    transcription_status[task_id]['download_speed'] = f"{(downloaded / 1024 / 1024 / elapsed):.1f} MB/s" if elapsed > 0 else "0 MB/s"
+        # The file is written and later split front to back; let the kernel know (Linux only)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        write_audio_stream(response, f, task_id)
     
     return filename
 
+def build_segment_command(source, base_name, segment_seconds, extra_args=()):
+    """Build an ffmpeg command that stream-copies MP3 audio into fixed-length chunk files."""
+    return ['ffmpeg', '-v', 'error', '-i', source, '-map', '0:a', '-c', 'copy',
+            '-f', 'segment', '-segment_time', str(segment_seconds),
+            *extra_args, f"{base_name}_chunk_%03d.mp3"]
+
+def parse_segment_list_entry(line, chunk_dir):
+    """Parse a line of ffmpeg's CSV segment list into (chunk_file, start_seconds, end_seconds)."""
+    chunk_name, start, end = line.strip().rsplit(',', 2)
+    return os.path.join(chunk_dir, chunk_name), float(start), float(end)
+
+def can_stream_split(url, response):
+    """Check whether an episode can be split into chunks while it is still downloading."""
+    # MP3 is a plain frame stream, so ffmpeg can segment it from a pipe without seeking.
+    # The server must also say it is MP3: a mislabelled file is downloaded instead,
+    # where probe_audio catches the real codec.
+    content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+    return (shutil.which('ffmpeg') is not None
+            and urlparse(url).path.lower().endswith('.mp3')
+            and content_type == 'audio/mpeg')
+
+def stream_audio_chunks(response, base_name, task_id, segment_seconds=STREAM_SEGMENT_SECONDS):
+    """Download audio straight into ffmpeg's segmenter and yield each chunk as soon as it is closed.
+    
+    Yields (chunk_index, chunk_file, start_seconds) tuples while the download is still running.
+    """
+    # ffmpeg stream-copies the input into fixed-length segments and reports
+    # every finished segment as a CSV line ("file,start,end") on stdout.
+    # stderr goes to a temp file: nothing reads it until the end, and a full
+    # pipe would block ffmpeg (and with it the download) forever.
+    stderr_file = tempfile.TemporaryFile()
+    process = subprocess.Popen(
+        build_segment_command('pipe:0', base_name, segment_seconds,
+                              ['-segment_list', 'pipe:1', '-segment_list_type', 'csv']),
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=stderr_file
+    )
+    
+    download_errors = []
+    
+    def feed_ffmpeg():
+        try:
+            write_audio_stream(response, process.stdin, task_id)
+        except Exception as e:
+            download_errors.append(e)
+        finally:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+    
+    feeder = threading.Thread(target=feed_ffmpeg)
+    feeder.daemon = True
+    feeder.start()
+    
+    try:
+        chunk_dir = os.path.dirname(base_name)
+        for i, line in enumerate(process.stdout):
+            chunk_file, start, _end = parse_segment_list_entry(line.decode('utf-8'), chunk_dir)
+            yield i, chunk_file, start
+        
+        feeder.join()
+        if download_errors:
+            raise download_errors[0]
+        if process.wait() != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode('utf-8', errors='replace').strip()
+            raise Exception(f"ffmpeg failed to split audio stream: {stderr}")
+        
+        transcription_status.set(task_id, 'status', 'transcribing')
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        stderr_file.close()
+
 def convert_apple_podcasts_url_to_rss(apple_url):
     """Convert Apple Podcasts URL to RSS feed URL using iTunes Lookup API."""
     try:
@@ -134,34 +471,70 @@ def convert_apple_podcasts_url_to_rss(apple_url):
     except Exception as e:
         return None, f"Error converting URL: {str(e)}"
 
-def get_audio_duration(audio_file):
-    """Get audio file duration in seconds."""
+def probe_audio(audio_file):
+    """Get audio duration in seconds and codec name of the first audio stream using ffprobe."""
+    output = subprocess.check_output([
+        'ffprobe', '-v', 'error', '-select_streams', 'a:0',
+        '-show_entries', 'format=duration:stream=codec_name', '-of', 'json', audio_file
+    ])
+    info = json.loads(output)
+    return float(info['format']['duration']), info['streams'][0]['codec_name']
+
+def split_audio_with_ffmpeg(audio_file, segment_seconds):
+    """Stream-copy an MP3 file into chunks with ffmpeg, returning (chunk_file, duration) pairs in order."""
+    base_name = os.path.splitext(audio_file)[0]
+    chunk_pattern = f"{glob.escape(base_name)}_chunk_*.mp3"
+    list_file = f"{base_name}_chunks.csv"
+    
     try:
-        import librosa
-        duration = librosa.get_duration(path=audio_file)
-        return duration
-    except:
-        # Fallback: estimate based on file size (rough estimate)
-        file_size_mb = os.path.getsize(audio_file) / (1024 * 1024)
-        # Rough estimate: 1MB ≈ 1 minute of audio
-        return file_size_mb * 60
-
-
-def split_audio_if_needed(audio_file, max_size_mb=24):
-    """Split audio file into chunks if it exceeds the maximum size limit for OpenAI API."""
-    file_size_mb = os.path.getsize(audio_file) / (1024 * 1024)
+        subprocess.run(build_segment_command(audio_file, base_name, segment_seconds,
+                                             ['-segment_list', list_file, '-segment_list_type', 'csv']),
+                       check=True, capture_output=True)
+        
+        # The segment list has the exact start/end time of every chunk
+        chunk_dir = os.path.dirname(base_name)
+        with open(list_file, encoding='utf-8') as f:
+            entries = [parse_segment_list_entry(line, chunk_dir) for line in f if line.strip()]
+        return [(chunk_file, end - start) for chunk_file, start, end in entries]
+    except (OSError, ValueError, subprocess.CalledProcessError) as e:
+        print(f"Error splitting audio with ffmpeg: {e}")
+        # Remove any partial chunks so the pydub fallback starts clean
+        for chunk_file in glob.glob(chunk_pattern):
+            os.remove(chunk_file)
+        return []
+    finally:
+        if os.path.exists(list_file):
+            os.remove(list_file)
+
+def split_audio_if_needed(audio_file, max_size_mb=MAX_UPLOAD_SIZE_MB):
+    """Split an audio file larger than the OpenAI API's upload limit into chunks.
     
-    if file_size_mb <= max_size_mb:
-        return [audio_file]
+    Returns a list of (chunk_file, duration_seconds) pairs in playback order.
+    """
+    file_size_mb = os.path.getsize(audio_file) / (1024 * 1024)
     
     print(f"Audio file is {file_size_mb:.1f}MB, splitting into chunks to fit OpenAI's {max_size_mb}MB limit...")
     
     # Calculate how many chunks we need
     num_chunks = int((file_size_mb / max_size_mb) + 1)
     
+    # MP3 can be cut at frame boundaries without decoding, so let ffmpeg copy the segments
+    try:
+        duration, codec = probe_audio(audio_file)
+    except (OSError, subprocess.CalledProcessError, KeyError, IndexError, ValueError):
+        duration, codec = None, None
+    
+    if codec == 'mp3' and duration:
+        chunks = split_audio_with_ffmpeg(audio_file, math.ceil(duration / num_chunks))
+        if chunks:
+            os.remove(audio_file)
+            return chunks
+    
+    # Fall back to decoding and re-encoding with pydub
     try:
-        # Load audio file
-        audio = AudioSegment.from_file(audio_file)
+        # Load audio file, resampled once to what Whisper uses internally (16 kHz mono)
+        # so the re-encoded chunks are smaller and quicker to encode and upload
+        audio = AudioSegment.from_file(audio_file).set_frame_rate(16000).set_channels(1)
         
         # Calculate chunk duration
         total_duration_ms = len(audio)
@@ -169,30 +542,189 @@ def split_audio_if_needed(audio_file, max_size_mb=24):
         
         # Split audio into chunks
         base_name = os.path.splitext(audio_file)[0]
-        chunk_files = []
+        chunks = []
         
         for i in range(num_chunks):
             start_time = i * chunk_duration_ms
-            end_time = min((i + 1) * chunk_duration_ms, total_duration_ms)
+            # The last chunk takes the remainder left by the integer division
+            end_time = total_duration_ms if i == num_chunks - 1 else (i + 1) * chunk_duration_ms
             
             # Extract chunk
             chunk = audio[start_time:end_time]
             chunk_file = f"{base_name}_chunk_{i+1}.mp3"
             
             # Export chunk
-            chunk.export(chunk_file, format="mp3")
+            chunk.export(chunk_file, format="mp3", bitrate="64k")
             
-            chunk_files.append(chunk_file)
+            chunks.append((chunk_file, (end_time - start_time) / 1000))
         
         # Remove original file
         os.remove(audio_file)
         
-        return chunk_files
+        return chunks
             
     except Exception as e:
-        print(f"Error splitting audio: {e}")
-        # If splitting fails, return original file
-        return [audio_file]
+        # The whole file is over the upload limit, so there is nothing useful to fall back to
+        raise Exception(f"Could not split audio into chunks under {max_size_mb}MB: {e}")
+
+def transcribe_file_openai(file):
+    """Upload audio to OpenAI Whisper API; accepts an open file or a (filename, file object) tuple."""
+    return client.audio.transcriptions.create(file=file, **TRANSCRIBE_KWARGS)
+
+def transcribe_chunk_openai(chunk_file):
+    """Transcribe a single audio chunk with OpenAI Whisper API, removing the chunk afterwards."""
+    try:
+        # Upload and transcribe chunk with OpenAI
+        with open(chunk_file, 'rb') as f:
+            return transcribe_file_openai(f)
+    finally:
+        # Clean up chunk file as soon as it is done (or failed) to free disk
+        if os.path.exists(chunk_file):
+            os.remove(chunk_file)
+
+def transcribe_chunks_concurrently(chunks, task_id):
+    """Transcribe (index, chunk_file, time_offset) jobs concurrently as they become available.
+    
+    Returns the list of segments with absolute timestamps, plus the plain transcript
+    text if the API returned no segments at all (otherwise an empty string).
+    """
+    chunk_transcripts = {}
+    time_offsets = {}
+    completed_count = 0
+    
+    # The work is I/O-bound on OpenAI's endpoint, so chunks are uploaded in parallel
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CHUNKS) as executor:
+        futures = {}
+        try:
+            for i, chunk_file, time_offset in chunks:
+                # With a streaming split, stop pulling chunks as soon as an upload has failed
+                failed = next((f for f in futures if f.done() and f.exception()), None)
+                if failed:
+                    os.remove(chunk_file)
+                    raise failed.exception()
+                
+                time_offsets[i] = time_offset
+                futures[executor.submit(transcribe_chunk_openai, chunk_file)] = (i, chunk_file)
+            
+            for future in as_completed(futures):
+                i, _chunk_file = futures[future]
+                chunk_transcripts[i] = future.result()
+                completed_count += 1
+                
+                # Update progress
+                transcription_status.update(task_id, {
+                    'progress': 10 + (completed_count / len(futures)) * 60,  # 10-70% for transcription
+                    'status': f'transcribing chunk {completed_count}/{len(futures)}'
+                })
+        except Exception:
+            # The task has failed: don't upload (and pay for) the chunks that haven't started yet
+            for future, (_i, chunk_file) in futures.items():
+                if future.cancel() and os.path.exists(chunk_file):
+                    os.remove(chunk_file)
+            raise
+    
+    # Assemble results in input order, adjusting timestamps by each chunk's position
+    all_segments = []
+    for i in range(len(chunk_transcripts)):
+        all_segments.extend(transcript_segments(chunk_transcripts[i], time_offsets[i]))
+    
+    fallback_text = ''
+    if not all_segments:
+        # No timestamps from the API: keep the plain chunk texts instead
+        fallback_text = ' '.join(chunk_transcripts[i].text for i in range(len(chunk_transcripts)))
+    
+    return all_segments, fallback_text
+
+def transcript_segments(chunk_transcript, time_offset=0.0):
+    """Convert API segments to dicts, shifting timestamps by the chunk's position in the episode."""
+    if not (hasattr(chunk_transcript, 'segments') and chunk_transcript.segments):
+        return []
+    
+    return [
+        {
+            'start': segment.start + time_offset,
+            'end': segment.end + time_offset,
+            # Whisper prefixes segment text with a space; strip it once here for both outputs
+            'text': segment.text.strip()
+        }
+        for segment in chunk_transcript.segments
+    ]
+
+def save_transcript(all_segments, output_txt, output_srt, task_id, upload_start, fallback_text=''):
+    """Write the TXT and SRT outputs and record the finished task.
+    
+    The TXT is built from the segments; `fallback_text` is only used when there are none.
+    """
+    language = TRANSCRIBE_KWARGS['language']
+    language_probability = 1.0
+    
+    transcription_status.update(task_id, {
+        'status': 'processing',
+        'progress': 50,
+        'language': language,
+        'language_probability': language_probability
+    })
+    
+    # Write full transcript (to a temp file first so a crash never leaves a partial transcript)
+    try:
+        with open(output_txt + '.tmp', 'w', encoding='utf-8') as f:
+            if all_segments:
+                f.write(' '.join(segment['text'] for segment in all_segments))
+            else:
+                f.write(fallback_text.strip())
+        os.replace(output_txt + '.tmp', output_txt)
+    except Exception:
+        if os.path.exists(output_txt + '.tmp'):
+            os.remove(output_txt + '.tmp')
+        raise
+    
+    transcription_status.set(task_id, 'progress', 75)
+    
+    # Write SRT subtitle file
+    try:
+        with open(output_srt + '.tmp', 'w', encoding='utf-8') as f:
+            if all_segments:
+                # Build the whole file in memory and write it once
+                _fmt = format_timestamp
+                f.write(''.join(
+                    f"{i}\n{_fmt(segment['start'])} --> {_fmt(segment['end'])}\n{segment['text']}\n\n"
+                    for i, segment in enumerate(all_segments, 1)
+                ))
+            else:
+                # Fallback: create a single subtitle entry
+                f.write("1\n")
+                f.write("00:00:00,000 --> 00:00:01,000\n")
+                f.write(fallback_text.strip())
+        os.replace(output_srt + '.tmp', output_srt)
+    except Exception:
+        if os.path.exists(output_srt + '.tmp'):
+            os.remove(output_srt + '.tmp')
+        raise
+    
+    # The record may have been evicted while the transcription ran
+    status = transcription_status.get(task_id) or {}
+    
+    # Store results before flagging completion so status polls always find them
+    transcription_results.create(task_id, {
+        'txt_file': output_txt,
+        'srt_file': output_srt,
+        'episode_title': status.get('episode_title', 'Unknown'),
+        'language': language,
+        'language_probability': language_probability,
+        'transcription_time': time.time() - upload_start
+    })
+    
+    transcription_status.update(task_id, {
+        'status': 'completed',
+        'progress': 100,
+        'expires_at': time.time() + TASK_RETENTION_SECONDS
+    })
+    
+    if status.get('audio_url'):
+        transcribed_episodes.create(status['audio_url'], {'task_id': task_id})
+    
+    # Clean up the task and its files once the retention period is over
+    schedule_expiry(task_id)
 
 def transcribe_audio_openai(audio_file, output_txt, output_srt, task_id):
     """Transcribe audio using OpenAI Whisper API - 10x faster!"""
@@ -200,137 +732,111 @@ def transcribe_audio_openai(audio_file, output_txt, output_srt, task_id):
         if not client:
             raise Exception("OpenAI API key not configured. Please set OPENAI_API_KEY environment variable.")
         
-        # Split audio if needed to fit OpenAI's 25MB limit
-        transcription_status[task_id]['status'] = 'splitting'
-        transcription_status[task_id]['progress'] = 5
-        
-        audio_chunks = split_audio_if_needed(audio_file, max_size_mb=24)
-        
-        # Get audio duration for time estimation (use first chunk if multiple)
-        audio_duration = get_audio_duration(audio_chunks[0])
-        if len(audio_chunks) > 1:
-            # Estimate total duration based on first chunk
-            audio_duration = audio_duration * len(audio_chunks)
+        if os.path.getsize(audio_file) <= MAX_UPLOAD_SIZE_MB * 1024 * 1024:
+            # Fits in one upload: no split, and no duration probe since the offset is 0
+            audio_chunks = [(audio_file, None)]
+        else:
+            # Split audio to fit OpenAI's 25MB limit
+            transcription_status.update(task_id, {'status': 'splitting', 'progress': 5})
+            audio_chunks = split_audio_if_needed(audio_file, max_size_mb=MAX_UPLOAD_SIZE_MB)
         
-        transcription_status[task_id]['audio_duration'] = audio_duration
-        estimated_transcription_time = max(30, audio_duration * 0.1)  # Estimate: 10% of audio duration, min 30 seconds
+        # Offset each chunk's segments by the real length of the chunks before it
+        jobs = []
+        cum_offset = 0.0
+        for i, (chunk_file, chunk_duration) in enumerate(audio_chunks):
+            jobs.append((i, chunk_file, cum_offset))
+            cum_offset += chunk_duration or 0.0
         
         # Update status
-        transcription_status[task_id]['status'] = 'transcribing'
-        transcription_status[task_id]['progress'] = 10
-        transcription_status[task_id]['eta'] = f"{estimated_transcription_time/60:.1f} min"
+        status_update = {'status': 'transcribing', 'progress': 10}
+        if cum_offset:
+            audio_duration = cum_offset
+            estimated_transcription_time = max(30, audio_duration * 0.1)  # Estimate: 10% of audio duration, min 30 seconds
+            status_update['audio_duration'] = audio_duration
+            status_update['eta'] = f"{estimated_transcription_time/60:.1f} min"
+        transcription_status.update(task_id, status_update)
         
         upload_start = time.time()
         
-        # Transcribe all chunks
-        all_segments = []
-        full_text = ""
+        all_segments, fallback_text = transcribe_chunks_concurrently(jobs, task_id)
         
-        for i, chunk_file in enumerate(audio_chunks):
-            # Update progress
-            progress = 10 + (i / len(audio_chunks)) * 60  # 10-70% for transcription
-            transcription_status[task_id]['progress'] = progress
-            transcription_status[task_id]['status'] = f'transcribing chunk {i+1}/{len(audio_chunks)}'
-            
-            # Upload and transcribe chunk with OpenAI
-            with open(chunk_file, 'rb') as f:
-                chunk_transcript = client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=f,
-                    language="no",  # Norwegian
-                    response_format="verbose_json",
-                    timestamp_granularities=["segment"]
-                )
-            
-            # Add chunk text to full text
-            full_text += chunk_transcript.text + " "
-            
-            # Adjust timestamps for segments (add offset based on chunk position)
-            if hasattr(chunk_transcript, 'segments') and chunk_transcript.segments:
-                chunk_duration = audio_duration / len(audio_chunks)
-                time_offset = i * chunk_duration
-                
-                for segment in chunk_transcript.segments:
-                    # Create a new segment dict with adjusted timestamps
-                    adjusted_segment = {
-                        'start': segment.start + time_offset,
-                        'end': segment.end + time_offset,
-                        'text': segment.text
-                    }
-                    all_segments.append(adjusted_segment)
-            
-            # Clean up chunk file
-            os.remove(chunk_file)
-            
-        # Create combined transcript object
-        class CombinedTranscript:
-            def __init__(self, text, segments, language):
-                self.text = text.strip()
-                self.segments = segments
-                self.language = language
-                self.language_probability = 1.0
-        
-        transcript = CombinedTranscript(full_text, all_segments, "no")
-        
-        transcription_status[task_id]['status'] = 'processing'
-        transcription_status[task_id]['progress'] = 50
-        transcription_status[task_id]['language'] = transcript.language
-        transcription_status[task_id]['language_probability'] = getattr(transcript, 'language_probability', 1.0)
-        
-        # Write full transcript
-        with open(output_txt, 'w', encoding='utf-8') as f:
-            f.write(transcript.text)
-        
-        transcription_status[task_id]['progress'] = 75
-        
-        # Write SRT subtitle file
-        with open(output_srt, 'w', encoding='utf-8') as f:
-            if hasattr(transcript, 'segments') and transcript.segments:
-                for i, segment in enumerate(transcript.segments, 1):
-                    start_time_srt = format_timestamp(segment['start'])
-                    end_time_srt = format_timestamp(segment['end'])
-                    f.write(f"{i}\n")
-                    f.write(f"{start_time_srt} --> {end_time_srt}\n")
-                    f.write(f"{segment['text'].strip()}\n\n")
-            else:
-                # Fallback: create a single subtitle entry
-                f.write("1\n")
-                f.write("00:00:00,000 --> 00:00:01,000\n")
-                f.write(transcript.text)
-        
-        transcription_status[task_id]['status'] = 'completed'
-        transcription_status[task_id]['progress'] = 100
-        
-        # Store results
-        transcription_results[task_id] = {
-            'txt_file': output_txt,
-            'srt_file': output_srt,
-            'episode_title': transcription_status[task_id].get('episode_title', 'Unknown'),
-            'language': transcript.language,
-            'language_probability': getattr(transcript, 'language_probability', 1.0),
-            'transcription_time': time.time() - upload_start
-        }
+        save_transcript(all_segments, output_txt, output_srt, task_id, upload_start, fallback_text)
         
         # Clean up audio file
         if os.path.exists(audio_file):
             os.remove(audio_file)
             
     except Exception as e:
-        transcription_status[task_id]['status'] = 'error'
-        transcription_status[task_id]['error'] = str(e)
+        transcription_status.update(task_id, {'status': 'error', 'error': str(e)})
+
+def transcribe_audio_in_memory(response, upload_name, output_txt, output_srt, task_id):
+    """Transcribe a download small enough for a single upload without writing it to disk."""
+    try:
+        if not client:
+            raise Exception("OpenAI API key not configured. Please set OPENAI_API_KEY environment variable.")
+        
+        # The announced size is within the upload limit, so a plain in-memory buffer is enough;
+        # it is capped at that limit in case the server sends more than it announced.
+        # (A SpooledTemporaryFile would roll over to disk as soon as httpx asks for its fileno.)
+        with io.BytesIO() as fp:
+            write_audio_stream(response, fp, task_id, max_bytes=MAX_UPLOAD_SIZE_MB * 1024 * 1024)
+            fp.seek(0)
+            
+            transcription_status.update(task_id, {'status': 'transcribing', 'progress': 10})
+            upload_start = time.time()
+            
+            transcript = transcribe_file_openai((upload_name, fp))
+        
+        segments = transcript_segments(transcript)
+        save_transcript(segments, output_txt, output_srt, task_id, upload_start,
+                        fallback_text='' if segments else transcript.text)
+        
+    except Exception as e:
+        transcription_status.update(task_id, {'status': 'error', 'error': str(e)})
+
+def transcribe_audio_stream(response, output_txt, output_srt, task_id):
+    """Download, split and transcribe audio as a pipeline so Whisper uploads start during the download."""
+    try:
+        if not client:
+            raise Exception("OpenAI API key not configured. Please set OPENAI_API_KEY environment variable.")
+        
+        upload_start = time.time()
+        
+        base_name = f"temp_audio_{task_id}"
+        chunks = stream_audio_chunks(response, base_name, task_id)
+        try:
+            all_segments, fallback_text = transcribe_chunks_concurrently(chunks, task_id)
+        finally:
+            # Stops ffmpeg (and the download) if an upload failed before the split finished
+            chunks.close()
+            for chunk_file in glob.glob(f"{glob.escape(base_name)}_chunk_*.mp3"):
+                os.remove(chunk_file)
+        
+        save_transcript(all_segments, output_txt, output_srt, task_id, upload_start, fallback_text)
+        
+    except Exception as e:
+        transcription_status.update(task_id, {'status': 'error', 'error': str(e)})
 
 def format_timestamp(seconds):
     """Format timestamp for SRT format (HH:MM:SS,mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millisecs = int((seconds % 1) * 1000)
+    # Round to whole milliseconds once so every field comes from exact integer math
+    millisecs = int(round(seconds * 1000))
+    hours, millisecs = divmod(millisecs, 3_600_000)
+    minutes, millisecs = divmod(millisecs, 60_000)
+    secs, millisecs = divmod(millisecs, 1000)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
 
 def get_episodes_from_rss(rss_url):
     """Parse RSS feed and return list of episodes."""
     try:
-        feed = feedparser.parse(rss_url)
+        # Revalidate with the feed's ETag/Last-Modified so unchanged feeds come back as a bodiless 304
+        with feed_validators_lock:
+            etag, modified, cached_episodes = feed_validators.get(rss_url, (None, None, None))
+        
+        feed = feedparser.parse(rss_url, etag=etag, modified=modified)
+        
+        if cached_episodes is not None and feed.get('status') == 304:
+            return cached_episodes, None
         
         if not feed.entries:
             return None, "No episodes found in RSS feed"
@@ -341,24 +847,54 @@ def get_episodes_from_rss(rss_url):
             audio_url = None
             if hasattr(entry, 'enclosures'):
                 for enclosure in entry.enclosures:
-                    if enclosure.type.startswith('audio/'):
+                    # Some feeds omit the enclosure type
+                    if (getattr(enclosure, 'type', '') or '').startswith('audio/'):
                         audio_url = enclosure.href
                         break
             
             if audio_url:
+                description = entry.get('description', '')
                 episodes.append({
                     'index': i,
                     'title': entry.title,
                     'published': entry.get('published', 'Unknown date'),
                     'audio_url': audio_url,
-                    'description': entry.get('description', '')[:200] + '...' if len(entry.get('description', '')) > 200 else entry.get('description', '')
+                    'description': (description[:200] + '...') if len(description) > 200 else description
                 })
         
+        if feed.get('etag') or feed.get('modified'):
+            with feed_validators_lock:
+                feed_validators[rss_url] = (feed.get('etag'), feed.get('modified'), episodes)
+                feed_validators.move_to_end(rss_url)
+                if len(feed_validators) > MAX_FEED_VALIDATORS:
+                    feed_validators.popitem(last=False)
+        
         return episodes, None
         
     except Exception as e:
         return None, f"Error parsing RSS feed: {str(e)}"
 
+def get_episodes_cached(rss_url):
+    """Return episodes for an RSS feed, reusing a parse from the last RSS_CACHE_TTL seconds."""
+    now = time.time()
+    with rss_cache_lock:
+        cached = rss_cache.get(rss_url)
+    
+    if cached and now - cached[0] < RSS_CACHE_TTL:
+        return cached[1], None
+    
+    print(f"RSS cache miss: {rss_url}")
+    episodes, error = get_episodes_from_rss(rss_url)
+    
+    if not error:
+        with rss_cache_lock:
+            # Drop expired feeds so the cache doesn't grow without bound
+            for url in [url for url, (fetched, _) in rss_cache.items() if now - fetched >= RSS_CACHE_TTL]:
+                del rss_cache[url]
+            rss_cache[rss_url] = (now, episodes)
+    
+    return episodes, error
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -371,7 +907,7 @@ def parse_rss():
         flash('Please enter an RSS feed URL', 'error')
         return redirect(url_for('index'))
     
-    episodes, error = get_episodes_from_rss(rss_url)
+    episodes, error = get_episodes_cached(rss_url)
     
     if error:
         flash(error, 'error')
@@ -390,27 +926,55 @@ def parse_rss():
 @app.route('/start_transcription', methods=['POST'])
 def start_transcription():
     rss_url = request.form.get('rss_url')
-    episode_index = int(request.form.get('episode_index'))
+    audio_url = request.form.get('audio_url', '').strip()
     
-    # Get episode details
-    episodes, error = get_episodes_from_rss(rss_url)
-    if error or episode_index >= len(episodes):
-        return jsonify({'error': 'Invalid episode selection'}), 400
+    if audio_url:
+        # The selection page posts the episode itself, so the feed doesn't need to be fetched again
+        parsed_audio_url = urlparse(audio_url)
+        if parsed_audio_url.scheme not in ('http', 'https') or not parsed_audio_url.netloc:
+            return jsonify({'error': 'Invalid episode selection'}), 400
+        
+        episode = {
+            'title': request.form.get('title', '').strip() or 'Unknown',
+            'audio_url': audio_url
+        }
+    else:
+        episode_index = int(request.form.get('episode_index'))
+        
+        # Get episode details (normally served from the cache filled by /parse_rss)
+        episodes, error = get_episodes_cached(rss_url)
+        if error or episode_index >= len(episodes):
+            return jsonify({'error': 'Invalid episode selection'}), 400
+        
+        episode = episodes[episode_index]
     
-    episode = episodes[episode_index]
+    # Reuse a finished transcript of the same episode while its files are still around
+    previous = transcribed_episodes.get(episode['audio_url'])
+    if previous and previous['task_id'] in transcription_status:
+        result = transcription_results.get(previous['task_id'])
+        if result and os.path.exists(result['txt_file']) and os.path.exists(result['srt_file']):
+            # Keep the reused task around for a full retention period from now; if it
+            # expired in the meantime, the update finds nothing and a new task is started
+            now = time.time()
+            if transcription_status.update(previous['task_id'], {
+                'expires_at': now + TASK_RETENTION_SECONDS,
+                'start_time': now
+            }):
+                return jsonify({'task_id': previous['task_id']})
     
     # Generate unique task ID
     task_id = str(uuid.uuid4())
     
     # Initialize status
-    transcription_status[task_id] = {
-        'status': 'starting',
+    transcription_status.create(task_id, {
+        'status': 'queued',
         'progress': 0,
         'episode_title': episode['title'],
+        'audio_url': episode['audio_url'],
         'download_progress': 0,
         'eta': 'Calculating...',
         'start_time': time.time()
-    }
+    })
     
     # Generate filenames
     parsed_url = urlparse(episode['audio_url'])
@@ -421,51 +985,69 @@ def start_transcription():
     # Start transcription in background thread
     def transcribe_thread():
         try:
+            transcription_status.set(task_id, 'status', 'starting')
+            
             # Download audio
-            transcription_status[task_id]['status'] = 'downloading'
-            download_audio(episode['audio_url'], audio_filename, task_id)
+            transcription_status.set(task_id, 'status', 'downloading')
+            response = open_audio_stream(episode['audio_url'])
+            total_size = int(response.headers.get('content-length', 0))
+            # Content-Length is the encoded size; a compressed body decodes to more than that
+            content_encoding = response.headers.get('content-encoding', 'identity').lower()
             
-            # Transcribe
-            transcribe_audio_openai(audio_filename, txt_filename, srt_filename, task_id)
+            if 0 < total_size <= MAX_UPLOAD_SIZE_MB * 1024 * 1024 and content_encoding == 'identity':
+                # Fits in a single upload, so skip the disk and the splitter entirely
+                upload_name = os.path.basename(parsed_url.path) or 'audio.mp3'
+                transcribe_audio_in_memory(response, upload_name, txt_filename, srt_filename, task_id)
+            elif can_stream_split(episode['audio_url'], response):
+                # Split and transcribe chunks while the download is still running
+                transcribe_audio_stream(response, txt_filename, srt_filename, task_id)
+            else:
+                download_audio(response, audio_filename, task_id)
+                
+                # Transcribe
+                transcribe_audio_openai(audio_filename, txt_filename, srt_filename, task_id)
             
         except Exception as e:
-            transcription_status[task_id]['status'] = 'error'
-            transcription_status[task_id]['error'] = str(e)
+            transcription_status.update(task_id, {'status': 'error', 'error': str(e)})
     
-    thread = threading.Thread(target=transcribe_thread)
-    thread.daemon = True
-    thread.start()
+    # Queue the job for the background workers
+    task_queue.put(transcribe_thread)
     
     return jsonify({'task_id': task_id})
 
 @app.route('/status/<task_id>')
 def get_status(task_id):
-    if task_id not in transcription_status:
+    # Read just the fields clients use instead of copying the whole stored task
+    response_data = transcription_status.get_fields(task_id, STATUS_RESPONSE_FIELDS + ('start_time',))
+    if response_data is None:
         return jsonify({'error': 'Task not found'}), 404
     
-    status = transcription_status[task_id].copy()
-    
     # Calculate elapsed time
-    if 'start_time' in status:
-        elapsed = time.time() - status['start_time']
-        status['elapsed_time'] = f"{elapsed/60:.1f} min"
+    start_time = response_data.pop('start_time', None)
+    if start_time is not None:
+        elapsed = time.time() - start_time
+        response_data['elapsed_time'] = f"{elapsed/60:.1f} min"
     
     # Add download link if completed
-    if status['status'] == 'completed' and task_id in transcription_results:
-        status['download_txt'] = url_for('download_file', task_id=task_id, file_type='txt')
-        status['download_srt'] = url_for('download_file', task_id=task_id, file_type='srt')
-        if 'transcription_time' in transcription_results[task_id]:
-            status['actual_transcription_time'] = f"{transcription_results[task_id]['transcription_time']:.1f} seconds"
+    result = None
+    if response_data.get('status') == 'completed':
+        result = transcription_results.get_fields(task_id, ('transcription_time',))
+    if result is not None:
+        response_data['download_txt'] = url_for('download_file', task_id=task_id, file_type='txt')
+        response_data['download_srt'] = url_for('download_file', task_id=task_id, file_type='srt')
+        if 'transcription_time' in result:
+            response_data['actual_transcription_time'] = f"{result['transcription_time']:.1f} seconds"
     
-    return jsonify(status)
+    response = jsonify(response_data)
+    response.headers['Cache-Control'] = 'no-store'
+    return response
 
 @app.route('/download/<task_id>/<file_type>')
 def download_file(task_id, file_type):
-    if task_id not in transcription_results:
+    result = transcription_results.get(task_id)
+    if not result:
         return "File not found", 404
     
-    result = transcription_results[task_id]
-    
     if file_type == 'txt':
         filename = result['txt_file']
         download_name = f"{result['episode_title'].replace(' ', '_')}.txt"
@@ -478,7 +1060,11 @@ def download_file(task_id, file_type):
     if not os.path.exists(filename):
         return "File not found", 404
     
-    return send_file(filename, as_attachment=True, download_name=download_name)
+    # Conditional responses let retrying clients revalidate with a 304 instead of re-downloading
+    response = send_file(filename, as_attachment=True, download_name=download_name,
+                         conditional=True, etag=True, last_modified=os.path.getmtime(filename))
+    response.headers['Cache-Control'] = 'private, max-age=3600'
+    return response
 
 @app.route('/transcription/<task_id>')
 def transcription_page(task_id):